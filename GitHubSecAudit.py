@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
 
-import base64
-import requests
-import urllib3
+import asyncio
+import collections
+import json
+import sqlite3
+import aiohttp
 import datetime
+import io
 import argparse
 import os
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+import random
+import re
+import time
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+MAX_CONCURRENCY = 64
+KEEPALIVE_TIMEOUT = 60
+MAX_RETRIES = 5
+BACKOFF_BASE = 1
+BACKOFF_CAP = 60
+NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'ghsecaudit.sqlite')
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -29,6 +47,21 @@ def parse_arguments():
         default='https://api.github.com',
         help="Optional: The GitHub API URL (default: https://api.github.com)."
     )
+    parser.add_argument(
+        '--include_archived',
+        action='store_true',
+        help="Optional: Also audit archived and disabled repositories (skipped by default)."
+    )
+    parser.add_argument(
+        '--include_forks',
+        action='store_true',
+        help="Optional: Also audit forked repositories (skipped by default)."
+    )
+    parser.add_argument(
+        '--no_cache',
+        action='store_true',
+        help=f"Optional: Do not reuse or update the ETag response cache ({CACHE_PATH})."
+    )
     return parser.parse_args()
 
 def check_github_token():
@@ -45,7 +78,11 @@ def check_github_token():
 
 args = parse_arguments()
 GITHUB_TOKEN = check_github_token()
-GITHUB_API_URL = args.api_url
+GITHUB_API_URL = args.api_url.rstrip('/')
+# GitHub Enterprise serves GraphQL at /api/graphql next to the REST /api/v3 root.
+GITHUB_GRAPHQL_URL = (
+    GITHUB_API_URL[:-len('/v3')] + '/graphql' if GITHUB_API_URL.endswith('/api/v3') else f'{GITHUB_API_URL}/graphql'
+)
 ORG_NAME = args.org_name
 
 headers = {
@@ -53,109 +90,297 @@ headers = {
     'Accept': 'application/vnd.github.v3+json'
 }
 
-def is_organization(org_name):
-    url = f"{GITHUB_API_URL}/users/{org_name}"
-    response = requests.get(url, headers=headers, verify=False)
-    if response.status_code == 403:
-        return 'Permission Denied'
-    response.raise_for_status()
-    user_data = response.json()
-    return user_data.get('type') == 'Organization'
-
-def get_org_members(org_name):
-    if is_organization(org_name) == 'Permission Denied':
-        return 'Permission Denied'
-    if not is_organization(org_name):
-        return [{'login': org_name}]
-
-    url = f'{GITHUB_API_URL}/orgs/{org_name}/members'
+# Everything the audit needs per repository, 100 repositories per request.
+REPOS_QUERY = """
+query($owner: String!, $after: String, $isFork: Boolean, $isArchived: Boolean) {
+  repositoryOwner(login: $owner) {
+    repositories(
+      first: 100, after: $after, ownerAffiliations: [OWNER], orderBy: {field: NAME, direction: ASC},
+      isFork: $isFork, isArchived: $isArchived
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        isDisabled
+        isEmpty
+        viewerCanAdminister
+        defaultBranchRef {
+          name
+          branchProtectionRule {
+            requiresApprovingReviews
+            requiredApprovingReviewCount
+            dismissesStaleReviews
+            requiresCommitSignatures
+            isAdminEnforced
+            allowsForcePushes
+            allowsDeletions
+            requiresConversationResolution
+          }
+        }
+        githubCodeowners: object(expression: "HEAD:.github/CODEOWNERS") { ... on Blob { text } }
+        rootCodeowners: object(expression: "HEAD:CODEOWNERS") { ... on Blob { text } }
+        docsCodeowners: object(expression: "HEAD:docs/CODEOWNERS") { ... on Blob { text } }
+      }
+    }
+  }
+}
+"""
+
+semaphore = None
+rate_limiter = None
+etag_cache = None
+
+class GitHubAPIError(Exception):
+    pass
+
+class ApiResponse(collections.namedtuple('ApiResponse', ['url', 'status', 'data', 'next_url'])):
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise GitHubAPIError(f"GitHub API request failed ({self.status}): {self.url}")
+
+class ETagCache:
+    """Keeps the last successful body per URL so reruns can revalidate with If-None-Match."""
+
+    def __init__(self, path):
+        # Cached bodies include member lists the token can see, so keep them private to this user.
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, etag TEXT, body BLOB, next_url TEXT)'
+        )
+
+    def get(self, url):
+        try:
+            return self.db.execute('SELECT etag, body, next_url FROM responses WHERE url = ?', (url,)).fetchone()
+        except sqlite3.Error as error:
+            warn_cache_unavailable(error)
+            return None
+
+    def set(self, url, etag, body, next_url):
+        try:
+            self.db.execute(
+                'INSERT OR REPLACE INTO responses (url, etag, body, next_url) VALUES (?, ?, ?, ?)',
+                (url, etag, body, next_url)
+            )
+        except sqlite3.Error as error:
+            warn_cache_unavailable(error)
+
+    def close(self):
+        try:
+            self.db.commit()
+        except sqlite3.Error as error:
+            warn_cache_unavailable(error)
+        finally:
+            self.db.close()
+
+def warn_cache_unavailable(error):
+    # The cache is only an optimization; a broken or locked cache must never stop the audit.
+    global etag_cache
+    if etag_cache is not None:
+        print(f"Warning: ETag cache unavailable ({error}); continuing without it.")
+    etag_cache = None
+
+def open_etag_cache(path):
+    try:
+        return ETagCache(path)
+    except (OSError, sqlite3.Error) as error:
+        print(f"Warning: ETag cache unavailable ({error}); continuing without it.")
+        return None
+
+class RateLimiter:
+    """Pauses requests to a rate-limit bucket (REST 'core', 'graphql') once GitHub reports it exhausted."""
+
+    def __init__(self):
+        self.locks = collections.defaultdict(asyncio.Lock)
+        self.remaining = {}
+        self.reset = {}
+        self.paused_until = {}
+
+    def update(self, resource, response):
+        # GitHub names the bucket a response was charged to; fall back to the one we expected.
+        resource = response.headers.get('X-RateLimit-Resource', resource)
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            self.remaining[resource] = int(remaining)
+        if reset is not None:
+            self.reset[resource] = int(reset)
+
+    async def wait(self, resource):
+        async with self.locks[resource]:
+            delay = self.paused_until.get(resource, 0) - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if self.remaining.get(resource) == 0:
+                delay = self.reset.get(resource, 0) - time.time() + 1
+                if delay > 0:
+                    print(f"Rate limit for '{resource}' exhausted, waiting {int(delay)}s for it to reset...")
+                    await asyncio.sleep(delay)
+                self.remaining.pop(resource, None)
+
+    def pause(self, resource, delay):
+        # Record a deadline rather than sleeping here, so simultaneous Retry-After hits share one pause in wait().
+        now = time.time()
+        paused_until = self.paused_until.get(resource, 0)
+        if paused_until <= now:
+            print(f"Secondary rate limit hit, retrying in {delay}s...")
+        self.paused_until[resource] = max(paused_until, now + delay)
+
+def backoff_delay(attempt):
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+def to_api_response(url, response, body, cached, cache):
+    status = response.status
+    next_match = NEXT_LINK_RE.search(response.headers.get('Link', ''))
+    next_url = next_match.group(1) if next_match else None
+    if status == 304 and cached:
+        # Not modified: GitHub doesn't charge this against the rate limit, reuse the stored body.
+        status, (_, body, next_url) = 200, cached
+    elif status == 200 and cache and 'ETag' in response.headers:
+        cache.set(url, response.headers['ETag'], body, next_url)
+    data = json_loads(body) if status == 200 and body else None
+    return ApiResponse(url, status, data, next_url)
+
+async def api_request(session, method, url, payload=None):
+    # Only GETs are revalidated; GraphQL POSTs always go to the server.
+    cache = etag_cache if method == 'GET' else None
+    cached = cache.get(url) if cache else None
+    request_headers = {'If-None-Match': cached[0]} if cached else None
+    resource = 'graphql' if url == GITHUB_GRAPHQL_URL else 'core'
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.wait(resource)
+        try:
+            async with semaphore:
+                async with session.request(method, url, json=payload, headers=request_headers) as response:
+                    body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
+            continue
+
+        rate_limiter.update(resource, response)
+        if response.status in (403, 429) and 'Retry-After' in response.headers:
+            rate_limiter.pause(resource, int(response.headers['Retry-After']))
+        elif response.status in (403, 429) and response.headers.get('X-RateLimit-Remaining') == '0':
+            continue
+        elif response.status >= 500 and attempt < MAX_RETRIES:
+            await asyncio.sleep(backoff_delay(attempt))
+        else:
+            break
+    return to_api_response(url, response, body, cached, cache)
+
+async def api_get(session, url):
+    return await api_request(session, 'GET', url)
+
+async def graphql_query(session, query, variables):
+    return await api_request(session, 'POST', GITHUB_GRAPHQL_URL, {'query': query, 'variables': variables})
+
+def format_graphql_errors(errors):
+    return '; '.join(error.get('message', '') for error in errors)
+
+async def get_org_members(session, org_name):
+    url = f'{GITHUB_API_URL}/orgs/{org_name}/members?per_page=100'
     members = []
     while url:
-        response = requests.get(url, headers=headers, verify=False)
-        if response.status_code == 403:
+        response = await api_get(session, url)
+        if response.status == 404 and not members:
+            # Not an organization, so the user account is its own only member.
+            return [{'login': org_name}]
+        if response.status == 403:
             return 'Permission Denied'
         response.raise_for_status()
-        members.extend(response.json())
-        url = response.links.get('next', {}).get('url')
+        # Only the login is reported; drop the rest of each member object right away.
+        members.extend({'login': member['login']} for member in response.data)
+        url = response.next_url
     return members
 
-def get_org_codeowners(org_name):
-    if not is_organization(org_name):
-        return []
-    url = f'{GITHUB_API_URL}/orgs/{org_name}/members?role=admin'
-    response = requests.get(url, headers=headers, verify=False)
-    if response.status_code == 403:
-        return 'Permission Denied'
-    response.raise_for_status()
-    admins = response.json()
-    return [admin['login'] for admin in admins]
-
-def get_org_repos(org_name):
-    org_type = is_organization(org_name)
-    if org_type == 'Permission Denied':
-        return 'Permission Denied'
-    url = f'{GITHUB_API_URL}/orgs/{org_name}/repos' if org_type else f'{GITHUB_API_URL}/users/{org_name}/repos'
-
-    repos = []
+async def get_org_codeowners(session, org_name):
+    url = f'{GITHUB_API_URL}/orgs/{org_name}/members?role=admin&per_page=100'
+    admins = []
     while url:
-        response = requests.get(url, headers=headers, verify=False)
-        if response.status_code == 403:
+        response = await api_get(session, url)
+        if response.status == 404 and not admins:
+            return []
+        if response.status == 403:
+            return 'Permission Denied'
+        response.raise_for_status()
+        admins.extend(admin['login'] for admin in response.data)
+        url = response.next_url
+    return admins
+
+def is_auditable(repo):
+    # Forks and archived repositories are filtered by the query itself; these have no query argument.
+    # Empty repositories have no default branch to check.
+    if repo['isEmpty']:
+        return False
+    return args.include_archived or not repo['isDisabled']
+
+async def get_org_repos(session, org_name):
+    repos = []
+    # A null filter returns both kinds of repository.
+    variables = {
+        'owner': org_name,
+        'after': None,
+        'isFork': None if args.include_forks else False,
+        'isArchived': None if args.include_archived else False,
+    }
+    while True:
+        response = await graphql_query(session, REPOS_QUERY, variables)
+        if response.status == 403:
             return 'Permission Denied'
         response.raise_for_status()
-        repos.extend(response.json())
-        url = response.links.get('next', {}).get('url')
-    return repos
-
-def get_default_branch(org_name, repo_name):
-    url = f"{GITHUB_API_URL}/repos/{org_name}/{repo_name}"
-    response = requests.get(url, headers=headers, verify=False)
-    response.raise_for_status()
-    repo_data = response.json()
-    return repo_data.get("default_branch", "main")
-
-def check_codeowners_file(org_name, repo_name):
-    default_branch = get_default_branch(org_name, repo_name)
-    locations_to_check = ['.github/CODEOWNERS', 'CODEOWNERS', 'docs/CODEOWNERS']
+        # GraphQL reports access problems (missing scopes, SAML enforcement) as errors next to null data.
+        errors = response.data.get('errors') or []
+        owner = (response.data.get('data') or {}).get('repositoryOwner')
+        if owner is None:
+            if any(error.get('type') == 'FORBIDDEN' for error in errors):
+                return 'Permission Denied'
+            if errors:
+                raise GitHubAPIError(f"GitHub GraphQL query failed: {format_graphql_errors(errors)}")
+            raise GitHubAPIError(f"GitHub organization or user not found: {org_name}")
+        page = owner['repositories']
+        unreadable = page['nodes'].count(None)
+        if unreadable:
+            details = f": {format_graphql_errors(errors)}" if errors else ""
+            print(f"Warning: {unreadable} repositories could not be read and were skipped{details}")
+        repos.extend(repo for repo in page['nodes'] if repo is not None and is_auditable(repo))
+        if not page['pageInfo']['hasNextPage']:
+            return repos
+        variables['after'] = page['pageInfo']['endCursor']
+
+def check_codeowners_file(repo):
+    default_branch = (repo['defaultBranchRef'] or {}).get('name', 'main')
     branch_status = "Not Set (File Missing)"
 
-    for location in locations_to_check:
-        url = f'{GITHUB_API_URL}/repos/{org_name}/{repo_name}/contents/{location}?ref={default_branch}'
-        response = requests.get(url, headers=headers, verify=False)
-
-        if response.status_code == 200:
-            codeowners_content = response.json().get('content')
-            if codeowners_content:
-                decoded_content = base64.b64decode(codeowners_content).decode('utf-8')
-                branch_status = "Set and Valid" if decoded_content.strip() else "Set but Invalid (Empty)"
-                break
-        elif response.status_code == 403:
-            branch_status = "Permission Denied"
-            break
-        elif response.status_code != 404:
-            branch_status = f"Error Checking {location} for {default_branch} branch"
+    # Aliases are ordered by lookup precedence: .github/, repository root, docs/.
+    for location in ('githubCodeowners', 'rootCodeowners', 'docsCodeowners'):
+        blob = repo.get(location)
+        if blob is not None:
+            codeowners_content = blob.get('text') or ''
+            branch_status = "Set and Valid" if codeowners_content.strip() else "Set but Invalid (Empty)"
             break
 
     return {default_branch: branch_status}
 
-def check_branch_protection(org_name, repo_name):
-    default_branch = get_default_branch(org_name, repo_name)
-    url = f'{GITHUB_API_URL}/repos/{org_name}/{repo_name}/branches/{default_branch}/protection'
-    response = requests.get(url, headers=headers, verify=False)
+def check_branch_protection(repo):
+    branch_ref = repo['defaultBranchRef'] or {}
+    default_branch = branch_ref.get('name', 'main')
+    protection_rule = branch_ref.get('branchProtectionRule')
+
+    if protection_rule:
+        required_approvals = (protection_rule['requiredApprovingReviewCount'] or 0) if protection_rule['requiresApprovingReviews'] else 0
+        dismiss_stale_reviews = "Enabled" if protection_rule['dismissesStaleReviews'] else "Disabled"
 
-    if response.status_code == 200:
-        protection_data = response.json()
-        
-        pr_reviews = protection_data.get('required_pull_request_reviews', {})
-        required_approvals = pr_reviews.get('required_approving_review_count', 0)
-        dismiss_stale_reviews = "Enabled" if pr_reviews.get('dismiss_stale_reviews', False) else "Disabled"
-        
-        signed_commits = "Enabled" if protection_data.get('required_signatures', {}).get('enabled', False) else "Disabled"
-        enforce_admins = "Enabled" if protection_data.get('enforce_admins', {}).get('enabled', False) else "Disabled"
+        signed_commits = "Enabled" if protection_rule['requiresCommitSignatures'] else "Disabled"
+        enforce_admins = "Enabled" if protection_rule['isAdminEnforced'] else "Disabled"
 
-        allow_force_pushes = "Enabled" if protection_data.get('allow_force_pushes', {}).get('enabled', False) else "Disabled"
-        allow_deletions = "Enabled" if protection_data.get('allow_deletions', {}).get('enabled', False) else "Disabled"
+        allow_force_pushes = "Enabled" if protection_rule['allowsForcePushes'] else "Disabled"
+        allow_deletions = "Enabled" if protection_rule['allowsDeletions'] else "Disabled"
 
-        conversation_resolution = "Enabled" if protection_data.get('required_conversation_resolution', {}).get('enabled', False) else "Disabled"
+        conversation_resolution = "Enabled" if protection_rule['requiresConversationResolution'] else "Disabled"
 
         return {
             'Branch': default_branch,
@@ -167,26 +392,106 @@ def check_branch_protection(org_name, repo_name):
             'Allow Deletions': allow_deletions,
             'Required Conversation Resolution': conversation_resolution
         }
-    elif response.status_code == 404:
-        return {default_branch: "No Protection"}
-    elif response.status_code == 403:
+    elif branch_ref and not repo['viewerCanAdminister']:
+        # Protection rules are only visible to repository admins.
         return {default_branch: "Permission Denied"}
     else:
-        return {default_branch: f"Error Checking Protection ({response.status_code})"}
+        return {default_branch: "No Protection"}
 
-def get_branch_protection_summary(org_name, repos):
+def get_branch_protection_summary(repos):
     protection_summary = {}
 
     for repo in repos:
-        repo_name = repo['name']
-        branch_protection = check_branch_protection(org_name, repo_name)
-        protection_summary[repo_name] = branch_protection
+        protection_summary[repo['name']] = check_branch_protection(repo)
 
     return protection_summary
 
+HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# (configuration, value when the branch is unprotected, expected value, check)
+PROTECTION_CHECKS = (
+    ("PR Approvals Required", 0, "2+", lambda current: current >= 2),
+    ("Signed Commits", "Disabled", "Enabled", lambda current: current == "Enabled"),
+    ("Enforce Admins", "Disabled", "Enabled", lambda current: current == "Enabled"),
+    # Without protection, force pushes and deletions really are allowed.
+    ("Allow Force Pushes", "Enabled", "Disabled", lambda current: current == "Disabled"),
+    ("Allow Deletions", "Enabled", "Disabled", lambda current: current == "Disabled"),
+    ("Required Conversation Resolution", "Disabled", "Enabled", lambda current: current == "Enabled"),
+)
+
+REPORT_COLUMNS = (
+    ('repo', "Repository Name", "col-repo"),
+    ('config', "Configuration", "col-config"),
+    ('verdict', "Status", "col-status"),
+    ('current', "Current Value", "col-value"),
+    ('expected', "Expected Value", "col-value"),
+)
+
+def escape_html(value):
+    return str(value).translate(HTML_ESCAPE)
+
+def iter_report_rows(codeowners_status, branch_protection_summary):
+    for repo, protection_info in branch_protection_summary.items():
+        repo = escape_html(repo)
+        # Protected branches report their settings; otherwise the branch maps to a status string.
+        status = None if 'Branch' in protection_info else next(iter(protection_info.values()))
+        for config, unprotected_value, expected, check in PROTECTION_CHECKS:
+            if status in (None, "No Protection"):
+                current = protection_info.get(config, unprotected_value)
+                correct = check(current)
+            else:
+                # The settings could not be read (e.g. "Permission Denied"), so show why instead of guessing.
+                current = status
+                correct = False
+            yield dict(
+                repo=repo,
+                config=config,
+                verdict='Correct' if correct else 'Incorrect',
+                current=escape_html(current),
+                expected=expected,
+            )
+
+    for repo, status in codeowners_status.items():
+        for branch, detail in status.items():
+            expected_status = "Set and Valid"
+            yield dict(
+                repo=escape_html(repo),
+                config="CODEOWNERS Status",
+                verdict='Correct' if detail == expected_status else 'Incorrect',
+                current=escape_html(detail),
+                expected=expected_status,
+            )
+
+def render_filter_header(label, css_class, values):
+    options = "".join(f'<option value="{value}">{value}</option>' for value in sorted(values))
+    return f'\n                        <th class="{css_class}"><select><option value="">{label}</option>{options}</select></th>'
+
+def write_report(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        remaining = memoryview(data)
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
 def generate_html_report(org_name, members, codeowners, codeowners_status, branch_protection_summary):
+    report_path = f"{org_name}_audit_report.html"
+    org_name = escape_html(org_name)
     report_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    html_content = f"""
+
+    # Collect each column's distinct values up front so the filters ship pre-populated.
+    column_values = {field: set() for field, _, _ in REPORT_COLUMNS}
+    for row in iter_report_rows(codeowners_status, branch_protection_summary):
+        for field, values in column_values.items():
+            values.add(row[field])
+    filter_headers = "".join(
+        render_filter_header(label, css_class, column_values[field]) for field, label, css_class in REPORT_COLUMNS
+    )
+
+    # Rows are streamed into an in-memory buffer and hit the disk in a single write.
+    with io.StringIO() as file:
+        file.write(f"""
     <html>
         <head>
             <title>{org_name} GitHub Audit Report</title>
@@ -213,32 +518,38 @@ def generate_html_report(org_name, members, codeowners, codeowners_status, branc
             <!-- DataTables CSS and JS for sorting, pagination, searching, and column filtering -->
             <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/1.11.5/css/jquery.dataTables.min.css"/>
             <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/buttons/1.7.1/css/buttons.dataTables.min.css"/>
+            <link rel="stylesheet" type="text/css" href="https://cdn.datatables.net/scroller/2.0.5/css/scroller.dataTables.min.css"/>
             <script type="text/javascript" src="https://code.jquery.com/jquery-3.5.1.js"></script>
             <script type="text/javascript" src="https://cdn.datatables.net/1.11.5/js/jquery.dataTables.min.js"></script>
             <script type="text/javascript" src="https://cdn.datatables.net/buttons/1.7.1/js/dataTables.buttons.min.js"></script>
             <script type="text/javascript" src="https://cdn.datatables.net/buttons/1.7.1/js/buttons.html5.min.js"></script>
+            <script type="text/javascript" src="https://cdn.datatables.net/scroller/2.0.5/js/dataTables.scroller.min.js"></script>
             <script>
                 $(document).ready(function() {{
                     // Initialize DataTable with column-specific filtering
                     var table = $('#detailed-report-table').DataTable({{
-                        "pageLength": 10,
-                        "lengthMenu": [[10, 25, 50, -1], [10, 25, 50, "All"]],
+                        // Rows ship as a JS array (reportRows, below the table) so deferRender only
+                        // creates nodes for the rows Scroller actually displays.
+                        "data": reportRows,
+                        "deferRender": true,
+                        "columnDefs": [{{
+                            "targets": 2,
+                            "createdCell": function (td, cellData) {{
+                                $(td).addClass(cellData === 'Correct' ? 'success' : 'issue');
+                            }}
+                        }}],
                         "order": [[0, "asc"]],
-                        "initComplete": function () {{
-                            this.api().columns().every(function (index) {{
-                                var column = this;
-                                var placeholder = ["Repository Name", "Configuration", "Status", "Current Value", "Expected Value"][index];
-                                var select = $('<select><option value="">' + placeholder + '</option></select>')
-                                    .appendTo($(column.header()).empty())  // Append filter to the header with placeholder
-                                    .on('change', function () {{
-                                        var val = $.fn.dataTable.util.escapeRegex($(this).val());
-                                        column.search(val ? '^' + val + '$' : '', true, false).draw();
-                                    }});
-                                column.data().unique().sort().each(function (d, j) {{
-                                    select.append('<option value="' + d + '">' + d + '</option>')
-                                }});
-                            }});
-                        }}
+                        "scrollY": "500px",
+                        "scroller": true
+                    }});
+
+                    // Filter options are rendered into the header by the script; only the handlers are bound here.
+                    $(table.table().header()).find('select').each(function (index) {{
+                        var column = table.column(index);
+                        $(this).on('change', function () {{
+                            var val = $.fn.dataTable.util.escapeRegex($(this).val());
+                            column.search(val ? '^' + val + '$' : '', true, false).draw();
+                        }});
                     }});
 
                     // Modal functionality for Members and Code Owners
@@ -271,7 +582,9 @@ def generate_html_report(org_name, members, codeowners, codeowners_status, branc
                     <span class="close" onclick="closeModal('reposModal')">&times;</span>
                     <h2>Repository List</h2>
                     <ul>
-                        {"".join([f"<li>{repo}</li>" for repo in branch_protection_summary.keys()])}
+                        """)
+        file.writelines(f"<li>{escape_html(repo)}</li>" for repo in branch_protection_summary)
+        file.write("""
                     </ul>
                 </div>
             </div>
@@ -282,7 +595,9 @@ def generate_html_report(org_name, members, codeowners, codeowners_status, branc
                     <span class="close" onclick="closeModal('membersModal')">&times;</span>
                     <h2>Organization Members</h2>
                     <ul>
-                        {"".join([f"<li>{member['login']}</li>" for member in members])}
+                        """)
+        file.writelines(f"<li>{escape_html(member['login'])}</li>" for member in members)
+        file.write("""
                     </ul>
                 </div>
             </div>
@@ -293,7 +608,9 @@ def generate_html_report(org_name, members, codeowners, codeowners_status, branc
                     <span class="close" onclick="closeModal('codeownersModal')">&times;</span>
                     <h2>Code Owners (Admins)</h2>
                     <ul>
-                        {"".join([f"<li>{owner}</li>" for owner in codeowners])}
+                        """)
+        file.writelines(f"<li>{escape_html(owner)}</li>" for owner in codeowners)
+        file.write(f"""
                     </ul>
                 </div>
             </div>
@@ -301,75 +618,66 @@ def generate_html_report(org_name, members, codeowners, codeowners_status, branc
             <h2>Detailed Report</h2>
             <table class="details-table" id="detailed-report-table">
                 <thead>
-                    <tr>
-                        <th class="col-repo">Repository Name</th>
-                        <th class="col-config">Configuration</th>
-                        <th class="col-status">Status</th>
-                        <th class="col-value">Current Value</th>
-                        <th class="col-value">Expected Value</th>
+                    <tr>{filter_headers}
                     </tr>
                 </thead>
-                <tbody>
-    """
-
-    for repo, protection_info in branch_protection_summary.items():
-        checks = [
-            ("PR Approvals Required", protection_info.get('PR Approvals Required', 0), "2+"),
-            ("Signed Commits", protection_info.get('Signed Commits', False), "Enabled"),
-            ("Enforce Admins", protection_info.get('Enforce Admins', False), "Enabled"),
-            ("Allow Force Pushes", protection_info.get('Allow Force Pushes', False), "Disabled"),
-            ("Allow Deletions", protection_info.get('Allow Deletions', False), "Disabled"),
-            ("Required Conversation Resolution", protection_info.get('Required Conversation Resolution', False), "Enabled"),
-        ]
-
-        for config, current, expected in checks:
-            status_class = "success" if (
-                str(current) == expected or (config == "PR Approvals Required" and current >= 2)
-            ) else "issue"
-            html_content += f"""
-                <tr>
-                    <td>{repo}</td>
-                    <td>{config}</td>
-                    <td class="{status_class}">{'Correct' if status_class == 'success' else 'Incorrect'}</td>
-                    <td>{'Enabled' if current is True else 'Disabled' if current is False else current}</td>
-                    <td>{expected}</td>
-                </tr>
-            """
+                <tbody></tbody>
+            </table>
+            <script>
+                var reportRows = [
+    """)
 
-    for repo, status in codeowners_status.items():
-        for branch, detail in status.items():
-            expected_status = "Set and Valid"
-            color_class = "success" if detail == expected_status else "issue"
-            html_content += f"""
-                <tr>
-                    <td>{repo}</td>
-                    <td>CODEOWNERS Status</td>
-                    <td class='{color_class}'>{'Correct' if color_class == 'success' else 'Incorrect'}</td>
-                    <td>{detail}</td>
-                    <td>{expected_status}</td>
-                </tr>
-            """
+        # Values are already HTML-escaped, so no "</script>" can appear inside the array.
+        for row in iter_report_rows(codeowners_status, branch_protection_summary):
+            file.write(json.dumps([row[field] for field, _, _ in REPORT_COLUMNS]) + ",\n")
 
-    html_content += """
-                </tbody>
-            </table>
-        </body>
-    </html>
-    """
-    
-    with open(f"{org_name}_audit_report.html", "w") as file:
-        file.write(html_content)
-    print(f"HTML report saved to {org_name}_audit_report.html")
+        file.write("""
+                ];
+            </script>
+            </body>
+        </html>
+        """)
+        report_bytes = file.getvalue().encode('utf-8')
+
+    write_report(report_path, report_bytes)
+    print(f"HTML report saved to {report_path}")
+
+
+async def main():
+    global semaphore, rate_limiter, etag_cache
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    rate_limiter = RateLimiter()
+    etag_cache = None if args.no_cache else open_etag_cache(CACHE_PATH)
+    # One keep-alive pool for the whole run so each TLS handshake is paid once per connection, not per call.
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENCY,
+        limit_per_host=MAX_CONCURRENCY,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=KEEPALIVE_TIMEOUT,
+        ssl=False,
+    )
+    try:
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            # Organization endpoints are tried optimistically and fall back on 404,
+            # so nothing has to wait for an organization-vs-user lookup first.
+            repos, members, codeowners = await asyncio.gather(
+                get_org_repos(session, ORG_NAME),
+                get_org_members(session, ORG_NAME),
+                get_org_codeowners(session, ORG_NAME),
+            )
+            if repos == 'Permission Denied':
+                print("Error: Access to repositories denied.")
+                return
+    finally:
+        if etag_cache:
+            etag_cache.close()
+            etag_cache = None
+
+    codeowners_status = {repo['name']: check_codeowners_file(repo) for repo in repos}
+    branch_protection_summary = get_branch_protection_summary(repos)
+
+    generate_html_report(ORG_NAME, members, codeowners, codeowners_status, branch_protection_summary)
 
 
 if __name__ == "__main__":
-    repos = get_org_repos(ORG_NAME)
-    if repos == 'Permission Denied':
-        print("Error: Access to repositories denied.")
-    else:
-        members = get_org_members(ORG_NAME)
-        codeowners = get_org_codeowners(ORG_NAME)
-        codeowners_status = {repo['name']: check_codeowners_file(ORG_NAME, repo['name']) for repo in repos}
-        branch_protection_summary = get_branch_protection_summary(ORG_NAME, repos)
-        
-        generate_html_report(ORG_NAME, members, codeowners, codeowners_status, branch_protection_summary)
+    asyncio.run(main())